@@ -2,7 +2,7 @@
 scrape_cricinfo_player.py
 
 Scrapes "relevant" ESPNcricinfo Statsguru player tables (batting, bowling, fielding, dismissal summaries, etc.)
-for a given player_id and saves everything to CSV + a single Excel workbook.
+for a given player_id and saves everything to Parquet (optionally CSV) + a single Excel workbook.
 
 Example URL you gave (fielding dismissal summary):
 https://stats.espncricinfo.com/ci/engine/player/625371.html?class=3;template=results;type=fielding;view=dismissal_summary
@@ -10,30 +10,51 @@ https://stats.espncricinfo.com/ci/engine/player/625371.html?class=3;template=res
 USAGE
 -----
 python scrape_cricinfo_player.py --player_id 625371 --out_dir data_625371
+python scrape_cricinfo_player.py --player_id 625371 --out_dir data_625371 --csv   # also write CSVs
 
 Dependencies
 ------------
-pip install requests pandas lxml beautifulsoup4 openpyxl tqdm
+pip install requests aiohttp aiolimiter pandas lxml xlsxwriter pyarrow tqdm
 
 Notes
 -----
-- ESPNcricinfo pages usually contain HTML tables; we use pandas.read_html for reliability.
+- ESPNcricinfo pages usually contain HTML tables; we read them straight from the lxml tree.
+- Pages are fetched concurrently (aiohttp); --concurrency bounds the number of in-flight requests
+  and --rate caps the request rate (token bucket, requests/second).
+- Fetched pages are cached under <out_dir>/http_cache for 24h, so re-runs don't hit the network
+  (use --no_cache to always re-fetch). After that, pages are revalidated with ETag /
+  Last-Modified conditional GETs, so unchanged pages cost a header-only 304.
 - If you get blocked (403 / bot protection), see the "If you get blocked" section at bottom.
 """
 
 from __future__ import annotations
 
 import argparse
+import asyncio
+import csv
+import hashlib
+import json
+import multiprocessing
 import os
 import re
+import threading
 import time
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
-
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from html import unescape
+from io import BytesIO
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+from urllib.parse import urlencode
+
+import aiohttp
+import lxml.etree
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
+import xlsxwriter
+from aiolimiter import AsyncLimiter
+from requests.adapters import HTTPAdapter
 from tqdm import tqdm
+from urllib3.util.retry import Retry
 
 
 BASE = "https://stats.espncricinfo.com/ci/engine/player/{player_id}.html"
@@ -49,15 +70,22 @@ DEFAULT_HEADERS = {
 }
 
 
+# How long a cached page is reused before it is fetched again.
+CACHE_EXPIRE_S = 24 * 3600
+
+
 @dataclass(frozen=True)
 class QuerySpec:
     type: str                      # batting | bowling | fielding | ...
     view: Optional[str] = None      # e.g., dismissal_summary
     cls: Optional[int] = None       # "class" in querystring (format)
-    extra_params: Optional[Dict[str, str]] = None
+    # Left out of the hash (dicts aren't hashable) but still compared by __eq__, so specs can be
+    # used as dict keys / set members even with extra_params set.
+    extra_params: Optional[Dict[str, str]] = field(default=None, hash=False)
 
 
-def make_url(player_id: int, spec: QuerySpec) -> str:
+def make_url(player_id: int, spec: QuerySpec, base: Optional[str] = None) -> str:
+    # `base` is BASE already formatted for player_id; pass it when building many URLs for one player.
     # ESPN Statsguru expects class first when present (e.g. class=3;template=results;type=fielding;view=...).
     params: List[Tuple[str, str]] = []
     if spec.cls is not None:
@@ -69,52 +97,354 @@ def make_url(player_id: int, spec: QuerySpec) -> str:
     if spec.extra_params:
         params.extend(spec.extra_params.items())
 
-    # Statsguru uses semicolon-separated query params.
-    qp = ";".join([f"{k}={v}" for k, v in params])
-    return BASE.format(player_id=player_id) + "?" + qp
+    # Statsguru uses semicolon-separated query params. "+" stays literal: callers pass
+    # pre-encoded spaces in date params (e.g. spanmin1=01+Jan+2025).
+    qp = urlencode(params, safe="+").replace("&", ";")
+    return (base or BASE.format(player_id=player_id)) + "?" + qp
+
+
+_SAFE_RE = re.compile(r"[^a-zA-Z0-9._-]+")
 
 
 def safe_filename(s: str) -> str:
-    s = re.sub(r"[^a-zA-Z0-9._-]+", "_", s.strip())
-    return s[:180] if len(s) > 180 else s
+    s = _SAFE_RE.sub("_", s.strip())
+    return s[:180]
 
 
-def fetch_html(session: requests.Session, url: str, sleep_s: float = 0.7) -> str:
-    r = session.get(url, headers=DEFAULT_HEADERS, timeout=30)
+def make_session(pool_maxsize: int = 16) -> requests.Session:
+    """
+    requests.Session for the synchronous fetch path: browser headers set once, pooled keep-alive
+    connections to the Statsguru host, and retries with exponential backoff on 429/5xx
+    (honouring Retry-After) instead of failing the request outright.
+    """
+    session = requests.Session()
+    session.headers.update(DEFAULT_HEADERS)
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 502, 503, 504],
+        respect_retry_after_header=True,
+    )
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class RateLimiter:
+    """
+    Token bucket for the synchronous fetch path: allows `rate` requests per second on average
+    (bursts of up to `burst`). Callers only wait when they are ahead of the rate, so a slow
+    response doesn't also pay a fixed sleep afterwards. Thread-safe.
+    """
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        if rate <= 0:
+            raise ValueError(f"rate must be > 0, got {rate}")
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            if self._tokens < 1:
+                time.sleep((1 - self._tokens) / self.rate)
+                self._last = time.monotonic()
+                self._tokens = 1.0
+            self._tokens -= 1
+
+
+def fetch_html(session: requests.Session, url: str, limiter: Optional[RateLimiter] = None) -> str:
     # Light rate limit to be polite.
-    time.sleep(sleep_s)
+    if limiter is not None:
+        limiter.wait()
+    # Headers come from the session (see make_session).
+    r = session.get(url, timeout=30)
 
     if r.status_code != 200:
         raise RuntimeError(f"HTTP {r.status_code} for {url}\nFirst 300 chars:\n{r.text[:300]}")
     return r.text
 
 
-def extract_page_title(html: str) -> str:
-    soup = BeautifulSoup(html, "html.parser")
-    title = soup.title.get_text(" ", strip=True) if soup.title else "cricinfo_page"
+def _cache_path(cache_dir: str, url: str, ext: str = ".html") -> str:
+    return os.path.join(cache_dir, hashlib.sha1(url.encode("utf-8")).hexdigest() + ext)
+
+
+def _atomic_write(path: str, data: bytes) -> None:
+    # Write-then-rename so an interrupted run never leaves a truncated file behind.
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def read_cached_page(cache_dir: str, url: str, expire_after: float = CACHE_EXPIRE_S) -> Optional[bytes]:
+    path = _cache_path(cache_dir, url)
+    try:
+        if time.time() - os.path.getmtime(path) > expire_after:
+            return None
+        with open(path, "rb") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def write_cached_page(
+    cache_dir: str,
+    url: str,
+    body: bytes,
+    etag: Optional[str] = None,
+    last_modified: Optional[str] = None,
+) -> None:
+    os.makedirs(cache_dir, exist_ok=True)
+    _atomic_write(_cache_path(cache_dir, url), body)
+    # Validators live in a sidecar so an expired page can be revalidated with a conditional GET.
+    validators = {"etag": etag, "last_modified": last_modified}
+    _atomic_write(_cache_path(cache_dir, url, ".json"), json.dumps(validators).encode("utf-8"))
+
+
+def conditional_headers(cache_dir: str, url: str) -> Dict[str, str]:
+    # If-None-Match / If-Modified-Since for a previously cached page (empty if there is none).
+    try:
+        with open(_cache_path(cache_dir, url, ".json"), encoding="utf-8") as f:
+            validators = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    headers = {}
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+    return headers
+
+
+async def fetch_html_async(
+    session: aiohttp.ClientSession,
+    sem: asyncio.Semaphore,
+    limiter: AsyncLimiter,
+    url: str,
+    cache_dir: Optional[str] = None,
+) -> bytes:
+    headers = DEFAULT_HEADERS
+    stale: Optional[bytes] = None
+    if cache_dir:
+        cached = read_cached_page(cache_dir, url)
+        if cached is not None:
+            return cached
+        # Expired: ask the server whether the page changed since we stored it.
+        stale = read_cached_page(cache_dir, url, expire_after=float("inf"))
+        if stale is not None:
+            headers = {**DEFAULT_HEADERS, **conditional_headers(cache_dir, url)}
+
+    # Raw bytes: lxml does its own charset handling, so skip aiohttp's decode step.
+    timeout = aiohttp.ClientTimeout(total=30)
+    async with sem, limiter, session.get(url, headers=headers, timeout=timeout) as r:
+        body = await r.read()
+
+    if r.status == 304 and stale is not None:
+        # Unchanged: reuse the stored body and restart its expiry clock.
+        os.utime(_cache_path(cache_dir, url))
+        return stale
+    if r.status != 200:
+        text = body[:300].decode("utf-8", "replace")
+        raise RuntimeError(f"HTTP {r.status} for {url}\nFirst 300 chars:\n{text}")
+
+    # Only successful pages are cached; errors are retried on the next run.
+    if cache_dir:
+        write_cached_page(
+            cache_dir,
+            url,
+            body,
+            etag=r.headers.get("ETag"),
+            last_modified=r.headers.get("Last-Modified"),
+        )
+    return body
+
+
+_TITLE_RE = re.compile(rb"<title[^>]*>(.*?)</title>", re.I | re.S)
+
+
+def extract_page_title(html: bytes) -> str:
+    # A regex is enough for one scalar; no need to build a document tree just for <title>.
+    m = _TITLE_RE.search(html)
+    title = unescape(m.group(1).decode("utf-8", "ignore")).strip() if m else ""
     # ESPN titles can be long; keep it shortish.
-    return title
+    return title or "cricinfo_page"
+
+
+# Caps on how many columns/rows a single cell may span; a bogus colspan="100000" would otherwise
+# blow up the row (or the table) into a huge list.
+_MAX_COLSPAN = 100
+_MAX_ROWSPAN = 1000
+# Cell whitespace is collapsed the same way pandas.read_html does it.
+_WHITESPACE_RE = re.compile(r"[\r\n]+|\s{2,}")
+# pandas' numeric pattern with "," as thousands separator (see read_html's thousands=",").
+_THOUSANDS_NUM_RE = re.compile(r"^[\-\+]?([0-9]+,|[0-9])*(\.[0-9]*)?([0-9]?(E|e)\-?[0-9]+)?$")
 
 
-def read_tables_from_html(html: str) -> List[pd.DataFrame]:
-    # Extract <table> fragments with BeautifulSoup (html.parser); parse each with pandas.
-    # This avoids lxml loading the full-page DOCTYPE/DTD and raising Errno 2.
-    soup = BeautifulSoup(html, "html.parser")
-    dfs = []
-    for table in soup.find_all("table"):
+def _span(cell: lxml.etree._Element, attr: str, cap: int) -> int:
+    try:
+        span = int(cell.get(attr, 1))
+    except ValueError:
+        span = 1
+    return min(max(span, 1), cap)
+
+
+_SpanRemainder = List[Tuple[int, Optional[str], int]]
+
+
+def _expand_spans(
+    trs: List[lxml.etree._Element],
+    remainder: Optional[_SpanRemainder] = None,
+    overflow: bool = True,
+) -> Tuple[List[List[Optional[str]]], _SpanRemainder]:
+    """
+    Cell texts per row with colspan repeated across columns and rowspan carried down into the
+    following rows, as pandas.read_html does (its _expand_colspan_rowspan).
+
+    `remainder` holds (column index, text, rows still to fill) for cells spanning down from a
+    previous section. With overflow=True, spans running past the last <tr> are returned as the
+    new remainder; otherwise they are emitted as extra rows.
+    """
+    all_texts: List[List[Optional[str]]] = []
+    remainder = list(remainder or [])
+
+    for tr in trs:
+        texts: List[Optional[str]] = []
+        next_remainder: List[Tuple[int, Optional[str], int]] = []
+        index = 0
+        for cell in tr.xpath("./th|./td"):
+            # Spanned-down cells that sit before this one in the row
+            while remainder and remainder[0][0] <= index:
+                prev_i, prev_text, prev_rowspan = remainder.pop(0)
+                texts.append(prev_text)
+                if prev_rowspan > 1:
+                    next_remainder.append((prev_i, prev_text, prev_rowspan - 1))
+                index += 1
+
+            text = _WHITESPACE_RE.sub(" ", "".join(cell.itertext())).strip() or None
+            rowspan = _span(cell, "rowspan", _MAX_ROWSPAN)
+            for _ in range(_span(cell, "colspan", _MAX_COLSPAN)):
+                texts.append(text)
+                if rowspan > 1:
+                    next_remainder.append((index, text, rowspan - 1))
+                index += 1
+
+        # Spanned-down cells after the last cell of this row
+        for prev_i, prev_text, prev_rowspan in remainder:
+            texts.append(prev_text)
+            if prev_rowspan > 1:
+                next_remainder.append((prev_i, prev_text, prev_rowspan - 1))
+
+        all_texts.append(texts)
+        remainder = next_remainder
+
+    if overflow:
+        return all_texts, remainder
+
+    # Rows that exist only because a rowspan runs past the last <tr>
+    while remainder:
+        texts = []
+        next_remainder = []
+        for prev_i, prev_text, prev_rowspan in remainder:
+            texts.append(prev_text)
+            if prev_rowspan > 1:
+                next_remainder.append((prev_i, prev_text, prev_rowspan - 1))
+        all_texts.append(texts)
+        remainder = next_remainder
+
+    return all_texts, []
+
+
+def _strip_thousands(text: Optional[str]) -> Optional[str]:
+    # read_html's default thousands=",": "1,234" -> "1234" whenever the cell looks like a number.
+    if text is not None and "," in text and _THOUSANDS_NUM_RE.search(text):
+        return text.replace(",", "")
+    return text
+
+
+def _header_names(cells: List[Optional[str]]) -> List[object]:
+    # Same naming as pandas.read_html: blanks become "Unnamed: i", repeats get ".1", ".2", ...
+    names: List[object] = []
+    counts: Dict[str, int] = {}
+    for i, text in enumerate(cells):
+        name = text or f"Unnamed: {i}"
+        if name in counts:
+            counts[name] += 1
+            name = f"{name}.{counts[name]}"
+        else:
+            counts[name] = 0
+        names.append(name)
+    return names
+
+
+def _table_to_df(table: lxml.etree._Element) -> pd.DataFrame:
+    # Only this table's own rows; nested layout tables are handled as separate tables.
+    head_trs = table.xpath("./thead/tr")
+    body_trs = table.xpath("./tbody/tr|./tr")
+    foot_trs = table.xpath("./tfoot/tr")
+    # Without <thead>, leading all-<th> rows are the header.
+    if not head_trs:
+        while body_trs and not body_trs[0].xpath("./td"):
+            head_trs.append(body_trs.pop(0))
+
+    # Multi-row headers are flattened to their last row (rowspans carried down into it) rather
+    # than read_html's MultiIndex: Parquet needs flat string column names.
+    # Rowspans carry over from header into body, and into the footer if there is one (as in read_html).
+    head, rem = _expand_spans(head_trs)
+    body_rows, rem = _expand_spans(body_trs, rem, overflow=bool(foot_trs))
+    foot_rows, _ = _expand_spans(foot_trs, rem, overflow=False)
+    header = head[-1] if head else []
+    rows = [r for r in body_rows + foot_rows if r]
+
+    # Rows wider than the header keep their extra cells, under "Unnamed: i" columns.
+    width = max([len(header)] + [len(r) for r in rows])
+    columns = _header_names(header + [None] * (width - len(header))) if header else list(range(width))
+    body = [[_strip_thousands(v) for v in r + [None] * (width - len(r))] for r in rows]
+
+    df = pd.DataFrame(body, columns=columns, dtype=object)
+    for col in df.columns:
         try:
-            dfs.append(pd.read_html(str(table))[0])
-        except (IndexError, ValueError, Exception):
-            continue
-    cleaned = []
-    for df in dfs:
+            df[col] = pd.to_numeric(df[col])
+        except (ValueError, TypeError):
+            pass
+    return df
+
+
+def iter_tables_from_html(html: bytes) -> Iterator[pd.DataFrame]:
+    # Stream the page: build each <table> straight from its lxml subtree as soon as it is closed
+    # (rather than round-tripping through pandas.read_html), then free it, so only one table's
+    # subtree is alive at a time. no_network: never fetch the external DTD named in the DOCTYPE.
+    events = lxml.etree.iterparse(
+        BytesIO(html),
+        events=("end",),
+        tag="table",
+        html=True,
+        encoding="utf-8",
+        no_network=True,
+        huge_tree=True,
+    )
+    for _, table in events:
+        df = _table_to_df(table)
+        table.clear()
+        while table.getprevious() is not None:
+            del table.getparent()[0]
+
         # Drop completely empty columns/rows so we don't save navigation/layout tables
         df = df.dropna(axis=1, how="all")
         df = df.dropna(axis=0, how="all")
         if df.shape[0] == 0 or df.shape[1] == 0:
             continue
-        cleaned.append(df)
-    return cleaned
+        yield df
+
+
+def read_tables_from_html(html: bytes) -> List[pd.DataFrame]:
+    return list(iter_tables_from_html(html))
 
 
 def normalize_tables(
@@ -122,45 +452,94 @@ def normalize_tables(
     meta: Dict[str, str],
 ) -> List[pd.DataFrame]:
     out = []
+    # Metadata columns go first, in the order repeated insert(0, ...) used to produce:
+    # _table_index, then the meta keys last-to-first.
+    meta_rev = dict(reversed(list(meta.items())))
     for i, df in enumerate(dfs, start=1):
-        df2 = df.copy()
-        # Attach metadata columns
-        for k, v in meta.items():
-            df2.insert(0, k, v)
-        df2.insert(0, "_table_index", i)
+        meta_cols = {"_table_index": i, **meta_rev}
+        # One assign + one reorder instead of a copy and an insert per column; assign returns a new frame.
+        df2 = df.assign(**meta_cols)
+        df2 = df2[list(meta_cols) + [c for c in df.columns if c not in meta_cols]]
         out.append(df2)
     return out
 
 
+# Below this many rows, CSVs are written with the stdlib csv module: for typical ~10-row Statsguru
+# tables DataFrame.to_csv spends most of its time in per-column formatting setup.
+_FAST_CSV_MAX_ROWS = 1000
+
+
+def _fast_to_csv(df: pd.DataFrame, path: str) -> None:
+    # Same output as df.to_csv(path, index=False): missing values as empty fields, minimal quoting.
+    with open(path, "w", newline="", encoding="utf-8", buffering=1 << 16) as f:
+        writer = csv.writer(f, quoting=csv.QUOTE_MINIMAL, lineterminator=os.linesep)
+        writer.writerow(df.columns)
+        writer.writerows(
+            ["" if v is None or v != v else v for v in row] for row in df.itertuples(index=False, name=None)
+        )
+
+
 def save_tables(
     tables: List[pd.DataFrame],
     out_dir: str,
     base_name: str,
+    write_csv: bool = False,
 ) -> List[str]:
+    # Parquet (zstd) is the primary artifact: compact and written by pyarrow's vectorised writer.
     os.makedirs(out_dir, exist_ok=True)
     saved = []
     for i, df in enumerate(tables, start=1):
-        fn = safe_filename(f"{base_name}__table{i}.csv")
-        path = os.path.join(out_dir, fn)
-        df.to_csv(path, index=False)
-        saved.append(path)
+        stem = os.path.join(out_dir, safe_filename(f"{base_name}__table{i}"))
+        # Parquet requires string column names (header-less tables have 0, 1, 2, ...).
+        df.rename(columns=str).to_parquet(stem + ".parquet", engine="pyarrow", compression="zstd", index=False)
+        saved.append(stem + ".parquet")
+        if write_csv:
+            if len(df) < _FAST_CSV_MAX_ROWS:
+                _fast_to_csv(df, stem + ".csv")
+            else:
+                df.to_csv(stem + ".csv", index=False)
+            saved.append(stem + ".csv")
     return saved
 
 
+def _unique_sheet_name(name: str, used: Set[str]) -> str:
+    # Excel sheet names are case-insensitive and limited to 31 chars; truncated keys can collide
+    # (e.g. the same type/view for different classes), so suffix repeats with (2), (3), ...
+    name = name[:31]
+    candidate, n = name, 1
+    while candidate.lower() in used:
+        n += 1
+        suffix = f"({n})"
+        candidate = name[: 31 - len(suffix)] + suffix
+    used.add(candidate.lower())
+    return candidate
+
+
 def write_excel_book(
     all_tables: Dict[str, List[pd.DataFrame]],
     excel_path: str,
 ) -> None:
-    # Excel sheet name limit is 31 chars.
-    with pd.ExcelWriter(excel_path, engine="openpyxl") as writer:
+    # Streamed with xlsxwriter in constant_memory mode: each row is flushed as soon as the next one
+    # starts, instead of the whole workbook being held in memory until close. That requires
+    # row-by-row writes, so we write rows ourselves rather than via DataFrame.to_excel.
+    # Cells are written as plain values: no formula/URL detection on every string.
+    options = {"constant_memory": True, "strings_to_formulas": False, "strings_to_urls": False}
+    workbook = xlsxwriter.Workbook(excel_path, options)
+    header_fmt = workbook.add_format({"bold": True})
+    used: Set[str] = set()
+    try:
         for key, dfs in all_tables.items():
-            # If multiple tables per key, split into multiple sheets.
-            for i, df in enumerate(dfs, start=1):
-                sheet = safe_filename(key)[:25]
-                if len(dfs) > 1:
-                    sheet = f"{sheet}_{i}"
-                sheet = sheet[:31]
-                df.to_excel(writer, sheet_name=sheet, index=False)
+            # One sheet per key: sibling tables are stacked (column union), told apart by the
+            # _table_index column normalize_tables adds. Far fewer sheets to create and zip up.
+            df = pd.concat(dfs, ignore_index=True) if len(dfs) > 1 else dfs[0]
+            # Excel sheet name limit is 31 chars.
+            ws = workbook.add_worksheet(_unique_sheet_name(safe_filename(key)[:25], used))
+            ws.write_row(0, 0, [str(c) for c in df.columns], header_fmt)
+            for r, row in enumerate(df.itertuples(index=False, name=None), start=1):
+                # Missing values become blank cells, as with to_excel.
+                ws.write_row(r, 0, [None if v != v else v for v in row])
+    finally:
+        workbook.close()
 
 
 def build_default_specs() -> List[QuerySpec]:
@@ -181,82 +560,226 @@ def build_default_specs() -> List[QuerySpec]:
     """
     classes_to_try = [1, 2, 3, 4, 5, 6]  # broad coverage
 
-    specs: List[QuerySpec] = []
+    # QuerySpec is hashable (frozen; extra_params excluded from the hash), so a dict de-duplicates
+    # while keeping insertion order.
+    specs: Dict[QuerySpec, None] = {}
 
     # Core "results" tables
+    core = [
+        ("batting", "innings"),
+        ("batting", "results"),
+        ("bowling", "innings"),
+        ("bowling", "results"),
+        ("fielding", "results"),
+        # Your provided view:
+        ("fielding", "dismissal_summary"),
+    ]
     for c in classes_to_try:
-        specs.extend(
-            [
-                QuerySpec(type="batting", cls=c, view="innings"),
-                QuerySpec(type="batting", cls=c, view="results"),
-                QuerySpec(type="bowling", cls=c, view="innings"),
-                QuerySpec(type="bowling", cls=c, view="results"),
-                QuerySpec(type="fielding", cls=c, view="results"),
-                # Your provided view:
-                QuerySpec(type="fielding", cls=c, view="dismissal_summary"),
-            ]
-        )
+        for t, v in core:
+            specs[QuerySpec(type=t, cls=c, view=v)] = None
 
     # Career aggregates / overall summaries (often with view=innings or view=results is enough)
     # Some pages also support view=match, view=career, etc. We'll try a few "common" ones without failing the whole run.
     extra_views = ["career", "match", "series"]
     for c in classes_to_try:
         for v in extra_views:
-            specs.append(QuerySpec(type="batting", cls=c, view=v))
-            specs.append(QuerySpec(type="bowling", cls=c, view=v))
-            specs.append(QuerySpec(type="fielding", cls=c, view=v))
-
-    # De-duplicate
-    uniq = []
-    seen = set()
-    for sp in specs:
-        key = (sp.type, sp.view, sp.cls, tuple(sorted((sp.extra_params or {}).items())))
-        if key not in seen:
-            seen.add(key)
-            uniq.append(sp)
-    return uniq
-
-
-def main(player_id: int, out_dir: str, sleep_s: float) -> None:
+            for t in ("batting", "bowling", "fielding"):
+                specs[QuerySpec(type=t, cls=c, view=v)] = None
+
+    return list(specs)
+
+
+def _query_params(href: str) -> Dict[str, str]:
+    # Statsguru links use ";" between params, but tolerate "&" too.
+    query = href.partition("?")[2]
+    return dict(p.partition("=")[::2] for p in re.split(r"[;&]", query) if p)
+
+
+def discover_available(html: bytes, player_id: int) -> Set[Tuple[str, Optional[int]]]:
+    """
+    (type, class) combinations the player's Statsguru home page links to, e.g. ("batting", 3).
+    The home page lists only the formats/disciplines the player actually has records for, so
+    anything else would come back as an empty page. Only links to this player's own page count;
+    site-wide Statsguru links (records, nav) exist for every format.
+    """
+    page = f"{player_id}.html"
+    root = lxml.etree.fromstring(html, lxml.etree.HTMLParser(encoding="utf-8", no_network=True))
+    available: Set[Tuple[str, Optional[int]]] = set()
+    if root is None:
+        return available
+    for href in root.xpath('//a[contains(@href, "template=results")]/@href'):
+        path = href.partition("?")[0]
+        if path != page and not path.endswith(f"/player/{page}"):
+            continue
+        params = _query_params(href)
+        if "type" not in params:
+            continue
+        try:
+            cls = int(params["class"]) if "class" in params else None
+        except ValueError:
+            continue
+        available.add((params["type"], cls))
+    return available
+
+
+def prune_specs(specs: List[QuerySpec], available: Set[Tuple[str, Optional[int]]]) -> List[QuerySpec]:
+    # Nothing discovered usually means the page layout changed; don't prune blindly in that case.
+    if not available:
+        return specs
+    # Types the page doesn't link at all (e.g. fielding) are kept for every class it does link.
+    linked_types = {t for t, _ in available}
+    linked_classes = {c for _, c in available}
+    return [
+        sp
+        for sp in specs
+        if (sp.type, sp.cls) in available or (sp.type not in linked_types and sp.cls in linked_classes)
+    ]
+
+
+def _parse_and_save(
+    html: bytes,
+    url: str,
+    spec: QuerySpec,
+    out_dir: str,
+    key: str,
+    write_csv: bool = False,
+) -> List[pd.DataFrame]:
+    # Runs in a worker process: parse one fetched page, attach metadata and write its tables.
+    title = extract_page_title(html)
+    dfs = read_tables_from_html(html)
+    if not dfs:
+        # No tables is common for unsupported combos; don't treat as fatal.
+        return []
+
+    meta = {
+        "_url": url,
+        "_title": title,
+        "_type": spec.type,
+        "_view": spec.view or "",
+        "_class": str(spec.cls) if spec.cls is not None else "",
+    }
+    dfs2 = normalize_tables(dfs, meta)
+
+    # Save tables per key
+    save_tables(dfs2, out_dir=out_dir, base_name=key, write_csv=write_csv)
+    return dfs2
+
+
+async def scrape_pages_async(
+    player_id: int,
+    specs: List[QuerySpec],
+    out_dir: str,
+    concurrency: int = 16,
+    rate: float = 4.0,
+    cache_dir: Optional[str] = None,
+    workers: Optional[int] = None,
+    write_csv: bool = False,
+    discover: bool = True,
+) -> Tuple[Dict[str, List[pd.DataFrame]], List[Tuple[str, str]]]:
+    """
+    Fetch every spec's page concurrently and hand each one to a process pool for parsing/table
+    writing as soon as it arrives, so CPU-bound parsing overlaps with the remaining downloads
+    and isn't confined to one core.
+
+    With discover=True the player's home page is fetched first and specs for (type, class)
+    combinations it doesn't link to are skipped (see discover_available).
+    """
+    # The semaphore + per-host connection limit bound requests in flight; the token bucket bounds
+    # requests per second without idling after responses that were already slow.
+    sem = asyncio.Semaphore(concurrency)
+    if rate <= 0:
+        raise ValueError(f"rate must be > 0, got {rate}")
+    # aiolimiter's bucket holds max_rate tokens, so below 1 req/s use one token per 1/rate seconds.
+    if rate >= 1:
+        limiter = AsyncLimiter(max_rate=rate, time_period=1.0)
+    else:
+        limiter = AsyncLimiter(max_rate=1, time_period=1.0 / rate)
+    connector = aiohttp.TCPConnector(limit_per_host=8, keepalive_timeout=30)
+    loop = asyncio.get_running_loop()
+
+    # Workers are started after aiohttp's resolver threads and tqdm's monitor thread exist;
+    # forking a multi-threaded process can deadlock a child, so use forkserver (spawn on Windows).
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    mp_context = multiprocessing.get_context(method)
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count(), mp_context=mp_context) as pool:
+        async with aiohttp.ClientSession(connector=connector) as session:
+            base_url = BASE.format(player_id=player_id)
+            if discover:
+                home_url = base_url
+                try:
+                    home = await fetch_html_async(session, sem, limiter, home_url, cache_dir=cache_dir)
+                    available = discover_available(home, player_id)
+                except Exception as e:
+                    print(f"Could not read {home_url} ({e or type(e).__name__}); trying all specs.")
+                    available = set()
+                pruned = prune_specs(specs, available)
+                if len(pruned) < len(specs):
+                    print(f"Skipping {len(specs) - len(pruned)} specs not linked from the player page.")
+                specs = pruned
+
+            urls = [make_url(player_id, spec, base=base_url) for spec in specs]
+            keys = [f"type={sp.type}__view={sp.view or 'none'}__class={sp.cls or 'none'}" for sp in specs]
+
+            with tqdm(total=len(specs), desc="Fetching tables") as pbar:
+
+                async def _scrape(spec: QuerySpec, url: str, key: str) -> List[pd.DataFrame]:
+                    try:
+                        html = await fetch_html_async(session, sem, limiter, url, cache_dir=cache_dir)
+                        return await loop.run_in_executor(
+                            pool, _parse_and_save, html, url, spec, out_dir, key, write_csv
+                        )
+                    finally:
+                        pbar.update(1)
+
+                # Results come back in spec order; failures are returned, not raised.
+                results = await asyncio.gather(
+                    *(_scrape(sp, u, k) for sp, u, k in zip(specs, urls, keys)),
+                    return_exceptions=True,
+                )
+
+    all_tables: Dict[str, List[pd.DataFrame]] = {}
+    failures: List[Tuple[str, str]] = []
+    for url, key, result in zip(urls, keys, results):
+        if isinstance(result, BaseException):
+            # Timeouts/connection errors often have an empty message.
+            failures.append((url, str(result) or type(result).__name__))
+        elif result:
+            all_tables[key] = result
+    return all_tables, failures
+
+
+def main(
+    player_id: int,
+    out_dir: str,
+    concurrency: int,
+    rate: float = 4.0,
+    use_cache: bool = True,
+    workers: Optional[int] = None,
+    write_csv: bool = False,
+    discover: bool = True,
+) -> None:
     out_dir = os.path.abspath(out_dir)
     os.makedirs(out_dir, exist_ok=True)
-    session = requests.Session()
+    cache_dir = os.path.join(out_dir, "http_cache") if use_cache else None
 
     specs = build_default_specs()
     print(f"Player ID: {player_id}")
     print(f"Total query specs to try: {len(specs)}")
     print(f"Output dir: {out_dir}")
 
-    all_tables: Dict[str, List[pd.DataFrame]] = {}
-    failures: List[Tuple[str, str]] = []
-
-    for spec in tqdm(specs, desc="Fetching tables"):
-        url = make_url(player_id, spec)
-        key = f"type={spec.type}__view={spec.view or 'none'}__class={spec.cls or 'none'}"
-        try:
-            html = fetch_html(session, url, sleep_s=sleep_s)
-            title = extract_page_title(html)
-            dfs = read_tables_from_html(html)
-            if not dfs:
-                # No tables is common for unsupported combos; don't treat as fatal.
-                continue
-
-            meta = {
-                "_url": url,
-                "_title": title,
-                "_type": spec.type,
-                "_view": spec.view or "",
-                "_class": str(spec.cls) if spec.cls is not None else "",
-            }
-            dfs2 = normalize_tables(dfs, meta)
-            all_tables[key] = dfs2
-
-            # Save CSVs per key
-            save_tables(dfs2, out_dir=out_dir, base_name=key)
-
-        except Exception as e:
-            failures.append((url, str(e)))
-            continue
+    all_tables, failures = asyncio.run(
+        scrape_pages_async(
+            player_id,
+            specs,
+            out_dir,
+            concurrency=concurrency,
+            rate=rate,
+            cache_dir=cache_dir,
+            workers=workers,
+            write_csv=write_csv,
+            discover=discover,
+        )
+    )
 
     # Write one combined Excel workbook too
     if all_tables:
@@ -280,26 +803,56 @@ def main(player_id: int, out_dir: str, sleep_s: float) -> None:
     print("\nDone.")
 
 
+def _positive_float(s: str) -> float:
+    value = float(s)
+    if value <= 0:
+        raise argparse.ArgumentTypeError(f"must be > 0, got {s}")
+    return value
+
+
 if __name__ == "__main__":
     ap = argparse.ArgumentParser()
     ap.add_argument("--player_id", type=int, required=True, help="ESPNcricinfo player id (e.g., 625371)")
     ap.add_argument("--out_dir", type=str, default="cricinfo_out", help="Output directory")
-    ap.add_argument("--sleep", type=float, default=0.7, help="Delay between requests (seconds)")
+    ap.add_argument("--concurrency", type=int, default=16, help="Max number of requests in flight at once")
+    ap.add_argument("--rate", type=_positive_float, default=4.0, help="Max requests per second")
+    ap.add_argument("--workers", type=int, default=None, help="Parser processes (default: CPU count)")
+    ap.add_argument("--csv", action="store_true", help="Also write a CSV next to each Parquet table")
+    ap.add_argument(
+        "--all_specs",
+        action="store_true",
+        help="Try every default spec instead of only the formats linked from the player's page",
+    )
+    ap.add_argument("--no_cache", action="store_true", help="Ignore the on-disk page cache and re-fetch everything")
     args = ap.parse_args()
 
-    main(player_id=args.player_id, out_dir=args.out_dir, sleep_s=args.sleep)
+    main(
+        player_id=args.player_id,
+        out_dir=args.out_dir,
+        concurrency=args.concurrency,
+        rate=args.rate,
+        use_cache=not args.no_cache,
+        workers=args.workers,
+        write_csv=args.csv,
+        discover=not args.all_specs,
+    )
 
 """
 If you get blocked (403 / bot protection):
 
+First, slow down: --concurrency 1 --rate 0.5 sends one request every 2 seconds.
+
 Option A (often works): add cloudscraper
     pip install cloudscraper
-    then replace requests.Session() with cloudscraper.create_scraper()
+cloudscraper is requests-based, so it can't replace the aiohttp session in scrape_pages_async.
+Use the synchronous path instead: create the session with cloudscraper.create_scraper()
+(rather than make_session()), get each page with fetch_html(session, make_url(player_id, spec)),
+and pass html.encode("utf-8") to read_tables_from_html.
 
 Option B (heavyweight): use Playwright to render + dump HTML:
     pip install playwright
     playwright install
-Then fetch page HTML via a headless browser and pass to pandas.read_html.
+Then fetch page HTML via a headless browser and pass its bytes to read_tables_from_html.
 
 If you want, paste your exact error (status code + first few lines) and I'll give you the
 least-painful unblock path for your setup.